@@ -0,0 +1,122 @@
+"""
+log_utilのバッファ付きファイルハンドラーのテスト
+"""
+
+import os
+import stat
+import logging
+import tempfile
+import unittest
+
+from utils.log_util import (
+    _BatchingMemoryHandler,
+    _BufferedFileHandler,
+    _BufferedRotatingFileHandler,
+)
+
+BATCH_SIZE = 1024
+
+
+def _write_syscalls() -> int:
+    """/proc/self/ioから現在までのwrite系システムコール回数を取得します。"""
+    with open('/proc/self/io') as f:
+        for line in f:
+            if line.startswith('syscw:'):
+                return int(line.split()[1])
+    raise RuntimeError('syscwが取得できません')
+
+
+@unittest.skipUnless(os.path.exists('/proc/self/io'), '/proc/self/ioが必要です')
+class BatchWriteSyscallTest(unittest.TestCase):
+    """1バッチのflushで発生するwriteシステムコール回数を検証します。"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def _count_batch_writes(self, handler: logging.Handler) -> int:
+        handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        buffered = _BatchingMemoryHandler(BATCH_SIZE, flushLevel=logging.ERROR, target=handler)
+        self.addCleanup(handler.close)
+        self.addCleanup(buffered.close)
+
+        record = logging.LogRecord('test', logging.INFO, __file__, 1, 'record', None, None)
+        for _ in range(BATCH_SIZE - 1):
+            buffered.handle(record)
+
+        # 最後のレコードで容量に達し、バッチ全体が出力される
+        before = _write_syscalls()
+        buffered.handle(record)
+        return _write_syscalls() - before
+
+    def test_file_handler_writes_batch_at_once(self):
+        path = os.path.join(self.tmp_dir.name, 'plain.log')
+        writes = self._count_batch_writes(_BufferedFileHandler(path, encoding='utf-8', delay=True))
+        self.assertLessEqual(writes, 2)
+
+    def test_rotating_handler_writes_batch_at_once(self):
+        path = os.path.join(self.tmp_dir.name, 'rotating.log')
+        handler = _BufferedRotatingFileHandler(path, maxBytes=10 * 1024 * 1024, backupCount=1,
+                                               encoding='utf-8', delay=True)
+        writes = self._count_batch_writes(handler)
+        self.assertLessEqual(writes, 2)
+
+
+class RotatingFileSizeTest(unittest.TestCase):
+    """ハンドラー側で管理するファイルサイズでローテーションされることを検証します。"""
+
+    def test_rotates_at_max_bytes(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'app.log')
+            handler = _BufferedRotatingFileHandler(path, maxBytes=1000, backupCount=3,
+                                                   encoding='utf-8', delay=True)
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            for i in range(100):
+                # マルチバイト文字を含め、文字数ではなくバイト数で判定されることを確認
+                handler.handle(logging.LogRecord('test', logging.INFO, __file__, 1,
+                                                 f'ログ{i:03d}' * 10, None, None))
+            handler.close()
+
+            for name in ('app.log', 'app.log.1', 'app.log.2', 'app.log.3'):
+                self.assertLess(os.path.getsize(os.path.join(tmp_dir, name)), 1000)
+
+    def test_counts_existing_file_size(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'app.log')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('x' * 995)
+
+            handler = _BufferedRotatingFileHandler(path, maxBytes=1000, backupCount=1,
+                                                   encoding='utf-8', delay=True)
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            handler.handle(logging.LogRecord('test', logging.INFO, __file__, 1,
+                                             'overflow', None, None))
+            handler.close()
+
+            self.assertEqual(os.path.getsize(path + '.1'), 995)
+            self.assertEqual(os.path.getsize(path), len('overflow\n'))
+
+    @unittest.skipUnless(hasattr(os, 'mkfifo'), 'os.mkfifoが必要です')
+    def test_does_not_rotate_non_regular_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'app.fifo')
+            os.mkfifo(path)
+            # 読み出し側を先に開いておき、書き込み側のopenがブロックしないようにする
+            reader = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+            try:
+                handler = _BufferedRotatingFileHandler(path, maxBytes=10, backupCount=1,
+                                                       encoding='utf-8', delay=True)
+                handler.setFormatter(logging.Formatter('%(message)s'))
+                for _ in range(3):
+                    handler.handle(logging.LogRecord('test', logging.INFO, __file__, 1,
+                                                     'longer than max bytes', None, None))
+                handler.close()
+            finally:
+                os.close(reader)
+
+            self.assertTrue(stat.S_ISFIFO(os.stat(path).st_mode))
+            self.assertFalse(os.path.exists(path + '.1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
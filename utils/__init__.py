@@ -62,16 +62,19 @@ from .string_util import (
     camel_to_snake,
     snake_to_camel,
     kebab_to_camel,
+    clear_identifier_caches,
     generate_random_string,
     mask_sensitive_data,
     extract_numbers,
     extract_emails,
     extract_urls,
+    extract_all,
     normalize_unicode,
     remove_accents,
     count_words,
     format_template,
     similarity_ratio,
+    similarity_ratio_matrix,
     clean_html_tags,
     validate_string_length
 )
@@ -118,12 +121,15 @@ from .validation_util import (
     is_valid_zip_code_jp,
     is_valid_url,
     is_valid_ip_address,
+    clear_validation_caches,
     is_valid_credit_card,
     is_valid_japanese_text,
     validate_password_strength,
     validate_age,
     validate_required_fields,
     validate_data_types,
+    validate_record,
+    is_valid_batch,
     validate_string_length as validate_string_length_detailed,
     validate_numeric_range,
     create_custom_validator
@@ -330,10 +336,11 @@ __all__ = [
 
     # 文字列操作
     'is_empty_or_whitespace', 'safe_strip', 'truncate_string', 'camel_to_snake',
-    'snake_to_camel', 'kebab_to_camel', 'generate_random_string', 'mask_sensitive_data',
-    'extract_numbers', 'extract_emails', 'extract_urls', 'normalize_unicode',
+    'snake_to_camel', 'kebab_to_camel', 'clear_identifier_caches',
+    'generate_random_string', 'mask_sensitive_data',
+    'extract_numbers', 'extract_emails', 'extract_urls', 'extract_all', 'normalize_unicode',
     'remove_accents', 'count_words', 'format_template', 'similarity_ratio',
-    'clean_html_tags', 'validate_string_length',
+    'similarity_ratio_matrix', 'clean_html_tags', 'validate_string_length',
 
     # ファイル操作
     'ensure_directory_exists', 'safe_read_file', 'safe_write_file',
@@ -350,9 +357,11 @@ __all__ = [
 
     # 検証
     'ValidationError', 'ValidationResult', 'is_valid_email', 'is_valid_phone_jp',
-    'is_valid_zip_code_jp', 'is_valid_url', 'is_valid_ip_address', 'is_valid_credit_card',
+    'is_valid_zip_code_jp', 'is_valid_url', 'is_valid_ip_address', 'clear_validation_caches',
+    'is_valid_credit_card',
     'is_valid_japanese_text', 'validate_password_strength', 'validate_age',
-    'validate_required_fields', 'validate_data_types', 'validate_string_length_detailed',
+    'validate_required_fields', 'validate_data_types', 'validate_record', 'is_valid_batch',
+    'validate_string_length_detailed',
     'validate_numeric_range', 'create_custom_validator',
 
     # 暗号化
@@ -4,14 +4,72 @@
 """
 
 import os
+import time
+import mmap
+import shutil
+import functools
+import atexit
+import queue
 import logging
 import logging.handlers
-import json
-import gzip
 from typing import Dict, Any, Optional, List, Union
 from datetime import datetime, timedelta
 from pathlib import Path
 from enum import Enum
+from collections import deque
+
+# オプショナルな依存関係のインポート
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    標準のjsonモジュールでdatetimeをISO形式に変換します。
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# 秒単位でキャッシュしたタイムスタンプの日時部分（秒, 文字列）
+_timestamp_cache = (None, '')
+
+
+def _format_timestamp(created: float) -> str:
+    """
+    UNIX時刻をローカル時刻のISO形式文字列に変換します。
+    日時部分は秒単位でキャッシュし、同じ秒内のレコードではマイクロ秒部分のみ組み立てます。
+    """
+    global _timestamp_cache
+    
+    seconds = int(created)
+    cached_seconds, prefix = _timestamp_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))
+        _timestamp_cache = (seconds, prefix)
+    
+    microseconds = min(round((created - seconds) * 1_000_000), 999_999)
+    return f'{prefix}.{microseconds:06d}'
+
+
+if ORJSON_AVAILABLE:
+    def _dumps(obj: Dict[str, Any]) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    # orjsonはdatetimeをネイティブにシリアライズできるため変換しない
+    _timestamp = datetime.fromtimestamp
+else:
+    def _dumps(obj: Dict[str, Any]) -> str:
+        # 標準のjsonモジュールは初回のJSON出力時に読み込む（以降はsys.modulesから取得）
+        import json
+        return json.dumps(obj, ensure_ascii=False, default=_json_default)
+
+    _timestamp = _format_timestamp
+
 
 # ログレベルの定義
 class LogLevel(Enum):
@@ -22,6 +80,36 @@ class LogLevel(Enum):
     CRITICAL = logging.CRITICAL
 
 
+# ログレベル名と数値の対応
+_LEVEL_NAMES = {
+    'NOTSET': logging.NOTSET,
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'WARN': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+    'FATAL': logging.CRITICAL
+}
+
+
+def _coerce_level(level: Union[str, int, LogLevel]) -> int:
+    """
+    LogLevel・レベル名・数値のいずれかをloggingの数値レベルに変換します。
+    
+    Raises:
+        ValueError: 不明なレベル名が指定された場合
+    """
+    if isinstance(level, LogLevel):
+        return level.value
+    if isinstance(level, str):
+        try:
+            return _LEVEL_NAMES[level.upper()]
+        except KeyError:
+            raise ValueError(f"不明なログレベル: {level}") from None
+    return level
+
+
 class ColoredFormatter(logging.Formatter):
     """
     カラー出力対応のログフォーマッター
@@ -37,18 +125,34 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'        # リセット
     }
     
+    # レベル名 → カラーコード付きのレベル名
+    _COLORED_LEVEL_NAMES = {
+        level_name: f"{color}{level_name}\033[0m"
+        for level_name, color in COLORS.items() if level_name != 'RESET'
+    }
+    
     def format(self, record):
-        # 元のフォーマットを適用
-        formatted = super().format(record)
-        
-        # カラーコードを追加
-        level_name = record.levelname
-        if level_name in self.COLORS:
-            color = self.COLORS[level_name]
-            reset = self.COLORS['RESET']
-            formatted = f"{color}{formatted}{reset}"
+        # レベル名のみにカラーコードを付けてフォーマットする（出力全体を再構築しない）
+        original = record.levelname
+        colored = self._COLORED_LEVEL_NAMES.get(original)
+        if colored is None:
+            return super().format(record)
         
-        return formatted
+        record.levelname = colored
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = original
+
+
+# LogRecordの標準属性（JSON出力の追加属性から除外する）
+_STD_LOGRECORD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+    'filename', 'module', 'lineno', 'funcName', 'created',
+    'msecs', 'relativeCreated', 'thread', 'threadName',
+    'processName', 'process', 'getMessage', 'exc_info',
+    'exc_text', 'stack_info', 'message', 'asctime', 'taskName'
+})
 
 
 class JSONFormatter(logging.Formatter):
@@ -58,7 +162,7 @@ class JSONFormatter(logging.Formatter):
     
     def format(self, record):
         log_entry = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'timestamp': _timestamp(record.created),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -71,16 +175,146 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_entry['exception'] = self.formatException(record.exc_info)
         
-        # 追加属性があれば追加
-        for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                          'filename', 'module', 'lineno', 'funcName', 'created',
-                          'msecs', 'relativeCreated', 'thread', 'threadName',
-                          'processName', 'process', 'getMessage', 'exc_info',
-                          'exc_text', 'stack_info']:
-                log_entry[key] = value
+        # 追加属性があれば追加（大半のレコードは追加属性を持たないため集合差で先に判定）
+        record_dict = record.__dict__
+        if record_dict.keys() - _STD_LOGRECORD_ATTRS:
+            for key, value in record_dict.items():
+                if key not in _STD_LOGRECORD_ATTRS:
+                    log_entry[key] = value
         
-        return json.dumps(log_entry, ensure_ascii=False)
+        return _dumps(log_entry)
+
+
+# デフォルトのフォーマット（フォーマッターは状態を持たないため全ハンドラーで共有する）
+_DEFAULT_FMT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_DEFAULT_FORMATTER = logging.Formatter(_DEFAULT_FMT)
+_DEFAULT_COLORED_FORMATTER = ColoredFormatter(_DEFAULT_FMT)
+_DEFAULT_JSON_FORMATTER = JSONFormatter()
+
+
+# ファイル書き込みバッファサイズ
+_FILE_BUFFER_SIZE = 64 * 1024
+
+
+class _BufferedStreamMixin:
+    """
+    書き込みバッファ付きでファイルを開き、バッチ出力中はレコードごとのflushを抑止するミックスイン
+    """
+
+    _in_batch = False
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=_FILE_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+
+    def flush(self):
+        if not self._in_batch:
+            super().flush()
+
+
+class _BufferedFileHandler(_BufferedStreamMixin, logging.FileHandler):
+    """
+    書き込みバッファ付きのファイルハンドラー
+    """
+
+
+class _BufferedRotatingFileHandler(_BufferedStreamMixin, logging.handlers.RotatingFileHandler):
+    """
+    書き込みバッファ付きのローテーションファイルハンドラー
+    ファイルサイズをハンドラー側で管理し、レコードごとのseek/tell（バッファのflushを伴う）を行いません。
+    """
+
+    # 現在のファイルサイズ（バイト）と、直前に判定したレコードのサイズ
+    _file_size = 0
+    _record_size = 0
+
+    def _open(self):
+        stream = super()._open()
+        self._file_size = os.path.getsize(self.baseFilename)
+        return stream
+
+    def shouldRollover(self, record):
+        # デバイスやFIFOなど通常ファイル以外はローテーションしない（標準ライブラリと同じ判定）
+        if os.path.exists(self.baseFilename) and not os.path.isfile(self.baseFilename):
+            self._record_size = 0
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0:
+            self._record_size = 0
+            return False
+
+        msg = self.format(record) + self.terminator
+        self._record_size = len(msg.encode(self.stream.encoding, self.stream.errors))
+        return self._file_size + self._record_size >= self.maxBytes
+
+    def doRollover(self):
+        super().doRollover()
+        self._file_size = 0
+
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            logging.FileHandler.emit(self, record)
+            self._file_size += self._record_size
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchingMemoryHandler(logging.handlers.MemoryHandler):
+    """
+    溜めたレコードをまとめて書き込み、最後に一度だけflushするメモリハンドラー
+    """
+
+    def flush(self):
+        self.acquire()
+        try:
+            target = self.target
+            if target is not None and self.buffer:
+                target._in_batch = True
+                try:
+                    for record in self.buffer:
+                        target.handle(record)
+                finally:
+                    target._in_batch = False
+                target.flush()
+                self.buffer.clear()
+        finally:
+            self.release()
+
+
+def _is_console_handler(handler: logging.Handler) -> bool:
+    """
+    ハンドラーがコンソール出力用のStreamHandlerかどうかを判定します（FileHandlerは除く）。
+    """
+    return isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler)
+
+
+def _close_handler_chain(handler: logging.Handler) -> None:
+    """
+    LogManagerが登録したハンドラーと、その後段（キューリスナー、バッファの出力先）を閉じます。
+    キューやバッファに残ったレコードは出力してから閉じます。複数回呼び出しても安全です。
+    
+    Args:
+        handler: ロガーに登録されていたハンドラー
+    """
+    # 非同期出力の場合はキューに残ったレコードを処理してから停止
+    listener = getattr(handler, '_queue_listener', None)
+    if listener is not None:
+        handler._queue_listener = None
+        atexit.unregister(listener.stop)
+        listener.stop()
+    
+    handler.flush()
+    handler.close()
+    
+    # 後段のハンドラー（バッファの出力先など）も前段から順に閉じる
+    downstream_handlers = getattr(handler, '_downstream_handlers', [])
+    handler._downstream_handlers = []
+    for downstream in downstream_handlers:
+        downstream.flush()
+        downstream.close()
 
 
 class LogManager:
@@ -113,39 +347,45 @@ class LogManager:
             enable_colors: カラー出力を有効にするかどうか
         """
         # レベルの変換
-        if isinstance(level, LogLevel):
-            level = level.value
-        elif isinstance(level, str):
-            level = getattr(logging, level.upper())
+        level = _coerce_level(level)
         
         self.logger.setLevel(level)
         
-        # 既存のハンドラーをクリア
-        self.logger.handlers.clear()
-        
-        # デフォルトフォーマット
+        # デフォルトフォーマットの場合は共有のフォーマッターを使用
         if format_string is None:
-            format_string = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        
-        # コンソールハンドラーを追加
-        console_handler = logging.StreamHandler()
-        
-        if enable_colors:
+            formatter = _DEFAULT_COLORED_FORMATTER if enable_colors else _DEFAULT_FORMATTER
+        elif enable_colors:
             formatter = ColoredFormatter(format_string)
         else:
             formatter = logging.Formatter(format_string)
         
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        # コンソールハンドラーは既存のもの（他のLogManagerが追加したものを含む）を再利用し、
+        # 重複したコンソールハンドラーは取り除く。ファイル等の他のハンドラーは残す
+        console_handler = self.handlers.get('console')
+        for existing in list(self.logger.handlers):
+            if not _is_console_handler(existing) or existing is console_handler:
+                continue
+            if console_handler is None:
+                console_handler = existing
+            else:
+                self.logger.removeHandler(existing)
+        
+        if console_handler is None:
+            console_handler = logging.StreamHandler()
+        if console_handler not in self.logger.handlers:
+            self.logger.addHandler(console_handler)
         self.handlers['console'] = console_handler
         
+        console_handler.setFormatter(formatter)
+        
         self._configured = True
         self.logger.info("基本ログ設定完了")
     
     def add_file_handler(self, file_path: Union[str, Path],
                         level: Union[str, int, LogLevel] = LogLevel.INFO,
                         format_string: Optional[str] = None,
-                        encoding: str = 'utf-8') -> bool:
+                        encoding: str = 'utf-8',
+                        buffer_capacity: int = 1024) -> bool:
         """
         ファイルハンドラーを追加します。
         
@@ -154,6 +394,7 @@ class LogManager:
             level: ログレベル
             format_string: フォーマット文字列
             encoding: ファイルエンコーディング
+            buffer_capacity: バッファに溜めるレコード数（0以下でバッファリングなし）
         
         Returns:
             bool: 追加成功の場合True
@@ -165,24 +406,20 @@ class LogManager:
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
             # レベルの変換
-            if isinstance(level, LogLevel):
-                level = level.value
-            elif isinstance(level, str):
-                level = getattr(logging, level.upper())
+            level = _coerce_level(level)
             
             # ファイルハンドラーを作成
-            file_handler = logging.FileHandler(file_path, encoding=encoding)
+            file_handler = _BufferedFileHandler(file_path, encoding=encoding, delay=True)
             file_handler.setLevel(level)
             
             # フォーマッターを設定
             if format_string is None:
-                format_string = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            
-            formatter = logging.Formatter(format_string)
+                formatter = _DEFAULT_FORMATTER
+            else:
+                formatter = logging.Formatter(format_string)
             file_handler.setFormatter(formatter)
             
-            self.logger.addHandler(file_handler)
-            self.handlers[f'file_{file_path.name}'] = file_handler
+            self._register_handler(f'file_{file_path.name}', file_handler, level, buffer_capacity)
             
             self.logger.info(f"ファイルハンドラー追加完了: {file_path}")
             return True
@@ -195,9 +432,11 @@ class LogManager:
                                  max_bytes: int = 10 * 1024 * 1024,  # 10MB
                                  backup_count: int = 5,
                                  level: Union[str, int, LogLevel] = LogLevel.INFO,
-                                 format_string: Optional[str] = None) -> bool:
+                                 format_string: Optional[str] = None,
+                                 buffer_capacity: int = 1024) -> bool:
         """
         ローテーションファイルハンドラーを追加します。
+        ファイルへの出力はバックグラウンドスレッドで行われます。
         
         Args:
             file_path: ログファイルパス
@@ -205,6 +444,7 @@ class LogManager:
             backup_count: バックアップファイル数
             level: ログレベル
             format_string: フォーマット文字列
+            buffer_capacity: バッファに溜めるレコード数（0以下でバッファリングなし）
         
         Returns:
             bool: 追加成功の場合True
@@ -216,26 +456,24 @@ class LogManager:
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
             # レベルの変換
-            if isinstance(level, LogLevel):
-                level = level.value
-            elif isinstance(level, str):
-                level = getattr(logging, level.upper())
+            level = _coerce_level(level)
             
             # ローテーションハンドラーを作成
-            rotating_handler = logging.handlers.RotatingFileHandler(
-                file_path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'
+            rotating_handler = _BufferedRotatingFileHandler(
+                file_path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8',
+                delay=True
             )
             rotating_handler.setLevel(level)
             
             # フォーマッターを設定
             if format_string is None:
-                format_string = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            
-            formatter = logging.Formatter(format_string)
+                formatter = _DEFAULT_FORMATTER
+            else:
+                formatter = logging.Formatter(format_string)
             rotating_handler.setFormatter(formatter)
             
-            self.logger.addHandler(rotating_handler)
-            self.handlers[f'rotating_{file_path.name}'] = rotating_handler
+            self._register_handler(f'rotating_{file_path.name}', rotating_handler, level,
+                                   buffer_capacity, use_queue=True)
             
             self.logger.info(f"ローテーションハンドラー追加完了: {file_path}")
             return True
@@ -245,13 +483,15 @@ class LogManager:
             return False
     
     def add_json_handler(self, file_path: Union[str, Path],
-                        level: Union[str, int, LogLevel] = LogLevel.INFO) -> bool:
+                        level: Union[str, int, LogLevel] = LogLevel.INFO,
+                        buffer_capacity: int = 1024) -> bool:
         """
         JSON形式のファイルハンドラーを追加します。
         
         Args:
             file_path: ログファイルパス
             level: ログレベル
+            buffer_capacity: バッファに溜めるレコード数（0以下でバッファリングなし）
         
         Returns:
             bool: 追加成功の場合True
@@ -263,21 +503,16 @@ class LogManager:
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
             # レベルの変換
-            if isinstance(level, LogLevel):
-                level = level.value
-            elif isinstance(level, str):
-                level = getattr(logging, level.upper())
+            level = _coerce_level(level)
             
             # JSONハンドラーを作成
-            json_handler = logging.FileHandler(file_path, encoding='utf-8')
+            json_handler = _BufferedFileHandler(file_path, encoding='utf-8', delay=True)
             json_handler.setLevel(level)
             
             # JSONフォーマッターを設定
-            json_formatter = JSONFormatter()
-            json_handler.setFormatter(json_formatter)
+            json_handler.setFormatter(_DEFAULT_JSON_FORMATTER)
             
-            self.logger.addHandler(json_handler)
-            self.handlers[f'json_{file_path.name}'] = json_handler
+            self._register_handler(f'json_{file_path.name}', json_handler, level, buffer_capacity)
             
             self.logger.info(f"JSONハンドラー追加完了: {file_path}")
             return True
@@ -298,10 +533,9 @@ class LogManager:
         """
         try:
             if handler_name in self.handlers:
-                handler = self.handlers[handler_name]
+                handler = self.handlers.pop(handler_name)
                 self.logger.removeHandler(handler)
-                handler.close()
-                del self.handlers[handler_name]
+                _close_handler_chain(handler)
                 self.logger.info(f"ハンドラー削除完了: {handler_name}")
                 return True
             else:
@@ -319,10 +553,7 @@ class LogManager:
         Args:
             level: ログレベル
         """
-        if isinstance(level, LogLevel):
-            level = level.value
-        elif isinstance(level, str):
-            level = getattr(logging, level.upper())
+        level = _coerce_level(level)
         
         self.logger.setLevel(level)
         self.logger.info(f"ログレベル変更: {logging.getLevelName(level)}")
@@ -336,6 +567,65 @@ class LogManager:
         """
         return self.logger
 
+    def _register_handler(self, handler_name: str, handler: logging.Handler,
+                          level: int, buffer_capacity: int,
+                          use_queue: bool = False) -> None:
+        """
+        ハンドラーをロガーに登録します。
+        buffer_capacityが正の場合はメモリバッファ経由で、use_queueがTrueの場合は
+        キュー経由でバックグラウンドスレッドから出力します。
+
+        Args:
+            handler_name: ハンドラー名
+            handler: 出力先のハンドラー
+            level: ログレベル
+            buffer_capacity: バッファに溜めるレコード数（0以下でバッファリングなし）
+            use_queue: 出力をバックグラウンドスレッドで行うかどうか
+        """
+        # 同じファイルへの同じ種類のハンドラーが登録済みの場合は置き換える
+        # （同じファイルを複数のハンドラーがローテーションしないようにする）
+        registration_key = f"{handler_name}:{getattr(handler, 'baseFilename', '')}"
+        for name, existing in list(self.handlers.items()):
+            if existing.get_name() == registration_key:
+                self.remove_handler(name)
+
+        # 他のLogManagerが登録したものは、残ったレコードを出力してから後段ごと閉じる
+        for existing in list(self.logger.handlers):
+            if existing.get_name() == registration_key:
+                self.logger.removeHandler(existing)
+                _close_handler_chain(existing)
+
+        downstream = []
+        listener = None
+
+        if buffer_capacity > 0:
+            buffered = _BatchingMemoryHandler(buffer_capacity, flushLevel=logging.ERROR,
+                                              target=handler, flushOnClose=True)
+            buffered.setLevel(level)
+            downstream.insert(0, handler)
+            handler = buffered
+
+        if use_queue:
+            log_queue = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(log_queue, handler,
+                                                      respect_handler_level=True)
+            listener.start()
+            # 終了時にキューに残ったレコードを出力する
+            atexit.register(listener.stop)
+
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            queue_handler.setLevel(level)
+            downstream.insert(0, handler)
+            handler = queue_handler
+
+        # 登録したハンドラーから後段を辿って閉じられるようにする（_close_handler_chain）
+        handler._queue_listener = listener
+        handler._downstream_handlers = downstream
+
+        handler.set_name(registration_key)
+        self.logger.addHandler(handler)
+        self.handlers[handler_name] = handler
+
 
 def setup_application_logging(app_name: str, log_dir: Union[str, Path] = 'logs',
                              log_level: Union[str, LogLevel] = LogLevel.INFO,
@@ -364,7 +654,7 @@ def setup_application_logging(app_name: str, log_dir: Union[str, Path] = 'logs',
     if enable_console:
         log_manager.setup_basic_logging(level=log_level, enable_colors=True)
     else:
-        log_manager.logger.setLevel(log_level.value if isinstance(log_level, LogLevel) else log_level)
+        log_manager.logger.setLevel(_coerce_level(log_level))
     
     log_dir = Path(log_dir)
     
@@ -393,11 +683,54 @@ def setup_application_logging(app_name: str, log_dir: Union[str, Path] = 'logs',
     return log_manager
 
 
+# ログ分析時に一度に走査するブロックサイズ
+_SCAN_BLOCK_SIZE = 1024 * 1024
+
+
+def _find_last_lines(mm: mmap.mmap, keyword: bytes, limit: int,
+                     exclude: Optional[bytes] = None) -> List[str]:
+    """
+    キーワードを含む行をファイル末尾から逆方向に検索し、最新のlimit件を返します。
+    
+    Args:
+        mm: 検索対象のメモリマップ
+        keyword: 検索するキーワード
+        limit: 取得する最大行数
+        exclude: この文字列を含む行は除外
+    
+    Returns:
+        List[str]: ファイル内の順序で並べた行のリスト
+    """
+    # 逆方向に見つかった行を先頭側へ追加し、最大limit件のみ保持する
+    lines = deque(maxlen=limit)
+    pos = len(mm)
+    
+    while len(lines) < limit:
+        index = mm.rfind(keyword, 0, pos)
+        if index < 0:
+            break
+        
+        line_start = mm.rfind(b'\n', 0, index) + 1
+        line_end = mm.find(b'\n', index)
+        if line_end < 0:
+            line_end = len(mm)
+        
+        line = mm[line_start:line_end]
+        if exclude is None or exclude not in line:
+            lines.appendleft(line.decode('utf-8', errors='replace').strip())
+        
+        # 同じ行を二重に数えないよう行頭より前から検索を続ける
+        pos = line_start
+    
+    return list(lines)
+
+
 def analyze_log_file(log_file: Union[str, Path], 
                     start_time: Optional[datetime] = None,
                     end_time: Optional[datetime] = None) -> Dict[str, Any]:
     """
     ログファイルを分析します。
+    ファイルをメモリマップし、レベルの集計はキーワードの出現回数で行います。
     
     Args:
         log_file: 分析するログファイル
@@ -422,30 +755,39 @@ def analyze_log_file(log_file: Union[str, Path],
             'file_size': log_file.stat().st_size
         }
         
-        with open(log_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                stats['total_lines'] += 1
-                
-                # ログレベルをカウント
-                for level in stats['levels']:
-                    if level in line:
-                        stats['levels'][level] += 1
-                        break
-                
-                # エラーと警告を収集
-                if 'ERROR' in line:
-                    stats['errors'].append(line.strip())
-                elif 'WARNING' in line:
-                    stats['warnings'].append(line.strip())
-                
-                # 時刻範囲の更新（簡易的な実装）
-                if stats['time_range']['start'] is None:
-                    stats['time_range']['start'] = line[:19]  # YYYY-MM-DD HH:MM:SS
-                stats['time_range']['end'] = line[:19]
+        # 空ファイルはメモリマップできないためそのまま返す
+        if stats['file_size'] == 0:
+            return stats
         
-        # エラーと警告は最新の10件のみ保持
-        stats['errors'] = stats['errors'][-10:]
-        stats['warnings'] = stats['warnings'][-10:]
+        with open(log_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            
+            # 行数とログレベルをブロック単位でカウント
+            # （ブロック境界をまたぐ一致を拾うため、各ブロックを最長キーワード長-1だけ延長する）
+            keywords = [(level, level.encode('ascii')) for level in stats['levels']]
+            overlap = max(len(keyword) for _, keyword in keywords) - 1
+            for offset in range(0, size, _SCAN_BLOCK_SIZE):
+                block = mm[offset:offset + _SCAN_BLOCK_SIZE + overlap]
+                stats['total_lines'] += block.count(b'\n', 0, _SCAN_BLOCK_SIZE)
+                for level, keyword in keywords:
+                    stats['levels'][level] += block.count(keyword, 0, _SCAN_BLOCK_SIZE + len(keyword) - 1)
+            
+            # 末尾に改行がない最終行も含める
+            if mm[size - 1:size] != b'\n':
+                stats['total_lines'] += 1
+            
+            # エラーと警告は最新の10件のみ収集
+            stats['errors'] = _find_last_lines(mm, b'ERROR', 10)
+            stats['warnings'] = _find_last_lines(mm, b'WARNING', 10, exclude=b'ERROR')
+            
+            # 時刻範囲の取得（簡易的な実装: 先頭行と最終行の先頭19文字 YYYY-MM-DD HH:MM:SS）
+            first_end = mm.find(b'\n')
+            if first_end < 0:
+                first_end = size
+            last_end = size - 1 if mm[size - 1:size] == b'\n' else size
+            last_start = mm.rfind(b'\n', 0, last_end) + 1
+            stats['time_range']['start'] = mm[0:min(first_end, 19)].decode('utf-8', errors='replace')
+            stats['time_range']['end'] = mm[last_start:min(last_end, last_start + 19)].decode('utf-8', errors='replace')
         
         return stats
         
@@ -453,18 +795,32 @@ def analyze_log_file(log_file: Union[str, Path],
         return {'error': str(e)}
 
 
-def compress_old_logs(log_dir: Union[str, Path], days_old: int = 7) -> Dict[str, Any]:
+# ログ圧縮時の読み書きチャンクサイズ
+_COMPRESS_CHUNK_SIZE = 1024 * 1024
+# gzipファイルのマジックバイト
+_GZIP_MAGIC = b'\x1f\x8b'
+
+
+def compress_old_logs(log_dir: Union[str, Path], days_old: int = 7,
+                      compresslevel: int = 1,
+                      min_size: int = 4096) -> Dict[str, Any]:
     """
     古いログファイルを圧縮します。
+    min_size未満のファイルと既にgzip形式のファイルはスキップします。
     
     Args:
         log_dir: ログディレクトリ
         days_old: この日数より古いファイルを圧縮
+        compresslevel: gzipの圧縮レベル（1:高速 〜 9:高圧縮）
+        min_size: 圧縮対象とする最小ファイルサイズ（バイト）
     
     Returns:
         Dict[str, Any]: 圧縮結果
     """
     try:
+        # 圧縮時のみ必要なため遅延インポート
+        import gzip
+        
         log_dir = Path(log_dir)
         
         if not log_dir.exists():
@@ -472,42 +828,63 @@ def compress_old_logs(log_dir: Union[str, Path], days_old: int = 7) -> Dict[str,
         
         cutoff_time = datetime.now() - timedelta(days=days_old)
         compressed_files = []
+        skipped_files = []
         total_saved_bytes = 0
         
-        for log_file in log_dir.glob('*.log'):
-            file_time = datetime.fromtimestamp(log_file.stat().st_mtime)
-            
-            if file_time < cutoff_time:
-                # 圧縮ファイル名
-                compressed_file = log_file.with_suffix('.log.gz')
-                
-                # ファイルを圧縮
-                with open(log_file, 'rb') as f_in:
-                    with gzip.open(compressed_file, 'wb') as f_out:
-                        f_out.writelines(f_in)
-                
-                # 元のファイルサイズと圧縮後のサイズを記録
-                original_size = log_file.stat().st_size
-                compressed_size = compressed_file.stat().st_size
-                saved_bytes = original_size - compressed_size
-                
-                compressed_files.append({
-                    'original': str(log_file),
-                    'compressed': str(compressed_file),
-                    'original_size': original_size,
-                    'compressed_size': compressed_size,
-                    'saved_bytes': saved_bytes
-                })
+        # DirEntryのstat結果はディレクトリ走査時に取得済みのものを再利用する
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.log') or not entry.is_file():
+                    continue
+                    
+                log_file = Path(entry.path)
+                st = entry.stat()
+                file_time = datetime.fromtimestamp(st.st_mtime)
                 
-                total_saved_bytes += saved_bytes
-                
-                # 元のファイルを削除
-                log_file.unlink()
+                if file_time < cutoff_time:
+                    original_size = st.st_size
+                    
+                    # 小さいファイルは圧縮してもほとんど削減できないためスキップ
+                    if original_size < min_size:
+                        skipped_files.append({'file': str(log_file), 'reason': 'too_small'})
+                        continue
+                    
+                    # 圧縮ファイル名
+                    compressed_file = log_file.with_suffix('.log.gz')
+                    
+                    # ファイルを圧縮
+                    with open(log_file, 'rb') as f_in:
+                        # 既にgzip形式のファイルはスキップ
+                        if f_in.read(len(_GZIP_MAGIC)) == _GZIP_MAGIC:
+                            skipped_files.append({'file': str(log_file), 'reason': 'already_gzipped'})
+                            continue
+                        f_in.seek(0)
+                        
+                        with gzip.open(compressed_file, 'wb', compresslevel=compresslevel) as f_out:
+                            shutil.copyfileobj(f_in, f_out, length=_COMPRESS_CHUNK_SIZE)
+                    
+                    # 圧縮後のサイズを記録
+                    compressed_size = compressed_file.stat().st_size
+                    saved_bytes = original_size - compressed_size
+                    
+                    compressed_files.append({
+                        'original': str(log_file),
+                        'compressed': str(compressed_file),
+                        'original_size': original_size,
+                        'compressed_size': compressed_size,
+                        'saved_bytes': saved_bytes
+                    })
+                    
+                    total_saved_bytes += saved_bytes
+                    
+                    # 元のファイルを削除
+                    log_file.unlink()
         
         result = {
             'success': True,
             'compressed_files': compressed_files,
             'total_files': len(compressed_files),
+            'skipped_files': skipped_files,
             'total_saved_bytes': total_saved_bytes,
             'total_saved_mb': round(total_saved_bytes / (1024 * 1024), 2)
         }
@@ -520,6 +897,11 @@ def compress_old_logs(log_dir: Union[str, Path], days_old: int = 7) -> Dict[str,
 
 # グローバルログマネージャー
 _global_log_manager: Optional[LogManager] = None
+# グローバルロガー（初回取得後にキャッシュ）
+_cached_default_logger: Optional[logging.Logger] = None
+
+# 名前付きロガーの取得（ロガーはlogging側で破棄されないため無制限にキャッシュ）
+_get_named_logger = functools.lru_cache(maxsize=None)(logging.getLogger)
 
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
@@ -532,14 +914,17 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     Returns:
         logging.Logger: ロガーインスタンス
     """
-    global _global_log_manager
+    global _global_log_manager, _cached_default_logger
     
     if name is None:
+        if _cached_default_logger is not None:
+            return _cached_default_logger
         if _global_log_manager is None:
             _global_log_manager = setup_application_logging('no1-utils')
-        return _global_log_manager.get_logger()
+        _cached_default_logger = _global_log_manager.get_logger()
+        return _cached_default_logger
     else:
-        return logging.getLogger(name)
+        return _get_named_logger(name)
 
 
 def log_function_call(func):
@@ -552,16 +937,28 @@ def log_function_call(func):
     Returns:
         デコレートされた関数
     """
+    name = func.__name__
+    # ロガーは初回呼び出し時に一度だけ取得する（デコレート時にログ設定を行わないため）
+    logger: Optional[logging.Logger] = None
+    
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        logger = get_logger()
-        logger.debug(f"関数呼び出し開始: {func.__name__}")
+        nonlocal logger
+        if logger is None:
+            logger = get_logger()
+        
+        # DEBUGが無効な場合はメッセージの組み立て自体を行わない
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(f"関数呼び出し開始: {name}")
         
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"関数呼び出し完了: {func.__name__}")
+            if debug_enabled:
+                logger.debug(f"関数呼び出し完了: {name}")
             return result
         except Exception as e:
-            logger.error(f"関数呼び出しエラー: {func.__name__} - {str(e)}")
+            logger.error(f"関数呼び出しエラー: {name} - {str(e)}")
             raise
     
     return wrapper
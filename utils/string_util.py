@@ -4,19 +4,53 @@
 """
 
 import re
+import sys
 import string
 import secrets
 import unicodedata
+import functools
 import logging
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Union, Tuple
 
 # ログ設定
 logger = logging.getLogger(__name__)
 
+# オプショナルな依存関係のインポート
+try:
+    from rapidfuzz.distance import Levenshtein
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 # 定数定義
 DEFAULT_ENCODING = 'utf-8'
 ALPHANUMERIC_CHARS = string.ascii_letters + string.digits
 SPECIAL_CHARS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+IDENTIFIER_CACHE_SIZE = 8192  # ケース変換結果のキャッシュ件数
+NORMALIZE_CACHE_SIZE = 4096  # Unicode正規化結果のキャッシュ件数
+NORMALIZE_CACHE_MAX_LENGTH = 256  # Unicode正規化結果をキャッシュする最大文字数
+
+# 正規表現パターン（パフォーマンス向上のためプリコンパイル）
+NUMBER_PATTERN = re.compile(r'\d+')
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+URL_PATTERN = re.compile(r'https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?')
+COMBINED_EXTRACT_PATTERN = re.compile(
+    f'(?P<emails>{EMAIL_PATTERN.pattern})|(?P<urls>{URL_PATTERN.pattern})|(?P<numbers>{NUMBER_PATTERN.pattern})'
+)
+WORD_PATTERN = re.compile(r'\b\w+\b')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# デコードするHTMLエンティティ（基本的なもののみ）
+HTML_ENTITIES = {
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&quot;': '"',
+    '&#39;': "'",
+    '&nbsp;': ' '
+}
+HTML_ENTITY_PATTERN = re.compile('|'.join(re.escape(entity) for entity in HTML_ENTITIES))
 
 
 def is_empty_or_whitespace(text: Optional[str]) -> bool:
@@ -69,9 +103,11 @@ def truncate_string(text: str, max_length: int, suffix: str = "...") -> str:
     return text[:max_length - len(suffix)] + suffix
 
 
+@functools.lru_cache(maxsize=IDENTIFIER_CACHE_SIZE)
 def camel_to_snake(text: str) -> str:
     """
     キャメルケースをスネークケースに変換します。
+    識別子は繰り返し変換されることが多いため、結果をキャッシュします。
     
     Args:
         text: 変換する文字列
@@ -79,14 +115,28 @@ def camel_to_snake(text: str) -> str:
     Returns:
         str: スネークケースに変換された文字列
     """
-    # 大文字の前にアンダースコアを挿入
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+    # 大文字の前にアンダースコアを挿入（1回の走査で処理）
+    # - 直前が英小文字・数字の大文字（例: userName → user_Name）
+    # - 直後が英小文字で、先頭・改行直後以外の大文字（例: HTTPServer → HTTP_Server）
+    result = []
+    last_index = len(text) - 1
+    
+    for i, char in enumerate(text):
+        if 'A' <= char <= 'Z' and i > 0:
+            prev_char = text[i - 1]
+            if ('a' <= prev_char <= 'z' or '0' <= prev_char <= '9'
+                    or (prev_char != '\n' and i < last_index and 'a' <= text[i + 1] <= 'z')):
+                result.append('_')
+        result.append(char)
+    
+    return ''.join(result).lower()
 
 
+@functools.lru_cache(maxsize=IDENTIFIER_CACHE_SIZE)
 def snake_to_camel(text: str, capitalize_first: bool = False) -> str:
     """
     スネークケースをキャメルケースに変換します。
+    識別子は繰り返し変換されることが多いため、結果をキャッシュします。
     
     Args:
         text: 変換する文字列
@@ -102,9 +152,11 @@ def snake_to_camel(text: str, capitalize_first: bool = False) -> str:
         return components[0] + ''.join(word.capitalize() for word in components[1:])
 
 
+@functools.lru_cache(maxsize=IDENTIFIER_CACHE_SIZE)
 def kebab_to_camel(text: str, capitalize_first: bool = False) -> str:
     """
     ケバブケースをキャメルケースに変換します。
+    識別子は繰り返し変換されることが多いため、結果をキャッシュします。
     
     Args:
         text: 変換する文字列
@@ -120,6 +172,35 @@ def kebab_to_camel(text: str, capitalize_first: bool = False) -> str:
         return components[0] + ''.join(word.capitalize() for word in components[1:])
 
 
+def clear_identifier_caches() -> None:
+    """
+    ケース変換関数（camel_to_snake, snake_to_camel, kebab_to_camel）のキャッシュをクリアします。
+    キャッシュはfunctools.lru_cacheによるもので、スレッドセーフです。
+    """
+    camel_to_snake.cache_clear()
+    snake_to_camel.cache_clear()
+    kebab_to_camel.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _random_byte_table(chars: str) -> Tuple[bytes, bytes]:
+    """
+    乱数バイトを文字に変換するbytes.translate用のテーブルを構築します。
+    剰余による偏りを避けるため、文字数の倍数に収まらないバイト値は削除対象とします。
+    
+    Args:
+        chars: 使用する文字（ASCIIのみ）
+    
+    Returns:
+        Tuple[bytes, bytes]: (変換テーブル, 削除するバイト値)
+    """
+    size = len(chars)
+    limit = (256 // size) * size
+    table = bytes(ord(chars[value % size]) if value < limit else 0 for value in range(256))
+    rejected = bytes(range(limit, 256))
+    return table, rejected
+
+
 def generate_random_string(length: int, include_special: bool = False) -> str:
     """
     ランダムな文字列を生成します。
@@ -135,7 +216,17 @@ def generate_random_string(length: int, include_special: bool = False) -> str:
     if include_special:
         chars += SPECIAL_CHARS
     
-    return ''.join(secrets.choice(chars) for _ in range(length))
+    # 乱数はまとめて取得し、bytes.translateで一括して文字に変換する
+    table, rejected = _random_byte_table(chars)
+    limit = 256 - len(rejected)
+    result = b''
+    
+    while len(result) < length:
+        remaining = length - len(result)
+        raw = secrets.token_bytes(remaining * 256 // limit + 16)
+        result += raw.translate(table, rejected)
+    
+    return result[:length].decode('ascii')
 
 
 def mask_sensitive_data(text: str, mask_char: str = "*", 
@@ -155,11 +246,11 @@ def mask_sensitive_data(text: str, mask_char: str = "*",
     if len(text) <= visible_start + visible_end:
         return mask_char * len(text)
     
-    start = text[:visible_start]
+    # 1つのバッファで組み立てる（中間文字列を作らない）
     end = text[-visible_end:] if visible_end > 0 else ""
-    middle = mask_char * (len(text) - visible_start - visible_end)
+    middle_length = len(text) - visible_start - visible_end
     
-    return start + middle + end
+    return f"{text[:visible_start]}{mask_char * middle_length}{end}"
 
 
 def extract_numbers(text: str) -> List[str]:
@@ -172,7 +263,7 @@ def extract_numbers(text: str) -> List[str]:
     Returns:
         List[str]: 抽出された数字のリスト
     """
-    return re.findall(r'\d+', text)
+    return NUMBER_PATTERN.findall(text)
 
 
 def extract_emails(text: str) -> List[str]:
@@ -185,8 +276,7 @@ def extract_emails(text: str) -> List[str]:
     Returns:
         List[str]: 抽出されたメールアドレスのリスト
     """
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    return re.findall(email_pattern, text)
+    return EMAIL_PATTERN.findall(text)
 
 
 def extract_urls(text: str) -> List[str]:
@@ -199,13 +289,37 @@ def extract_urls(text: str) -> List[str]:
     Returns:
         List[str]: 抽出されたURLのリスト
     """
-    url_pattern = r'https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?'
-    return re.findall(url_pattern, text)
+    return URL_PATTERN.findall(text)
+
+
+def extract_all(text: str) -> Dict[str, List[str]]:
+    """
+    文字列からメールアドレス・URL・数字を1回の走査でまとめて抽出します。
+    各部分はメールアドレス、URL、数字の優先順でいずれか1つに分類されるため、
+    メールアドレスやURLに含まれる数字は'numbers'には含まれません。
+    
+    Args:
+        text: 処理する文字列
+    
+    Returns:
+        Dict[str, List[str]]: 'emails', 'urls', 'numbers'をキーとする抽出結果
+    """
+    result = {'emails': [], 'urls': [], 'numbers': []}
+    
+    for match in COMBINED_EXTRACT_PATTERN.finditer(text):
+        result[match.lastgroup].append(match.group())
+    
+    return result
+
+
+# 短い文字列（ラベルやキーなど）の正規化結果のキャッシュ
+_cached_normalize = functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(unicodedata.normalize)
 
 
 def normalize_unicode(text: str, form: str = 'NFC') -> str:
     """
     Unicode文字列を正規化します。
+    NORMALIZE_CACHE_MAX_LENGTH文字以下の文字列は結果をキャッシュします。
     
     Args:
         text: 正規化する文字列
@@ -214,9 +328,24 @@ def normalize_unicode(text: str, form: str = 'NFC') -> str:
     Returns:
         str: 正規化された文字列
     """
+    if len(text) <= NORMALIZE_CACHE_MAX_LENGTH:
+        return _cached_normalize(form, text)
     return unicodedata.normalize(form, text)
 
 
+@functools.lru_cache(maxsize=None)
+def _combining_mark_table() -> Dict[int, None]:
+    """
+    結合文字（Unicodeカテゴリ'Mn'）を削除するstr.translate用の変換テーブルを構築します。
+    全コードポイントの走査が必要なため、初回呼び出し時に一度だけ構築します。
+    """
+    return {
+        code_point: None
+        for code_point in range(sys.maxunicode + 1)
+        if unicodedata.category(chr(code_point)) == 'Mn'
+    }
+
+
 def remove_accents(text: str) -> str:
     """
     文字列からアクセント記号を除去します。
@@ -230,7 +359,7 @@ def remove_accents(text: str) -> str:
     # NFD正規化でアクセント記号を分離
     nfd = unicodedata.normalize('NFD', text)
     # 結合文字（アクセント記号）を除去
-    return ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
+    return nfd.translate(_combining_mark_table())
 
 
 def count_words(text: str, language: str = 'en') -> int:
@@ -246,13 +375,20 @@ def count_words(text: str, language: str = 'en') -> int:
     """
     if language == 'ja':
         # 日本語の場合は文字数をカウント（空白を除く）
-        return len(re.sub(r'\s+', '', text))
+        return len(WHITESPACE_PATTERN.sub('', text))
     else:
         # 英語の場合は単語数をカウント
-        words = re.findall(r'\b\w+\b', text)
+        words = WORD_PATTERN.findall(text)
         return len(words)
 
 
+class _SafeDict(dict):
+    """format_map用の辞書。存在しないキーは{key}のまま残します。"""
+    
+    def __missing__(self, key):
+        return '{' + key + '}'
+
+
 def format_template(template: str, variables: Dict[str, Any], 
                    safe_mode: bool = True) -> str:
     """
@@ -269,11 +405,7 @@ def format_template(template: str, variables: Dict[str, Any],
     try:
         if safe_mode:
             # 存在しない変数はそのまま残す
-            class SafeDict(dict):
-                def __missing__(self, key):
-                    return '{' + key + '}'
-            
-            return template.format_map(SafeDict(variables))
+            return template.format_map(_SafeDict(variables))
         else:
             return template.format(**variables)
     except KeyError as e:
@@ -281,9 +413,74 @@ def format_template(template: str, variables: Dict[str, Any],
         raise
 
 
+def _char_position_masks(text: str) -> Dict[str, int]:
+    """
+    文字ごとの出現位置をビットマスクで表した辞書を作成します。
+    
+    Args:
+        text: 対象の文字列
+    
+    Returns:
+        Dict[str, int]: 文字 → 出現位置のビットマスク
+    """
+    masks: Dict[str, int] = {}
+    for i, char in enumerate(text):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _levenshtein_distance(text1: str, text2: str,
+                          peq: Optional[Dict[str, int]] = None) -> int:
+    """
+    2つの文字列のレーベンシュタイン距離を計算します。
+    Myersのビット並列アルゴリズムを使用し、text1の各位置をPythonの整数の1ビットとして扱います。
+    
+    Args:
+        text1: 比較する文字列1
+        text2: 比較する文字列2
+        peq: text1の_char_position_masks()の結果（複数回比較する場合に再利用）
+    
+    Returns:
+        int: 編集距離
+    """
+    length = len(text1)
+    if length == 0:
+        return len(text2)
+    
+    if peq is None:
+        peq = _char_position_masks(text1)
+    
+    full_mask = (1 << length) - 1
+    last_bit = 1 << (length - 1)
+    vp = full_mask
+    vn = 0
+    distance = length
+    
+    for char in text2:
+        eq = peq.get(char, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | (~(xh | vp) & full_mask)
+        hn = vp & xh
+        
+        if hp & last_bit:
+            distance += 1
+        elif hn & last_bit:
+            distance -= 1
+        
+        hp = ((hp << 1) | 1) & full_mask
+        hn = (hn << 1) & full_mask
+        vp = hn | (~(xv | hp) & full_mask)
+        vn = hp & xv
+    
+    return distance
+
+
 def similarity_ratio(text1: str, text2: str) -> float:
     """
-    2つの文字列の類似度を計算します（簡易版）。
+    2つの文字列の類似度を計算します。
+    大文字・小文字を区別せず、正規化したレーベンシュタイン距離（1 - 距離 / 長い方の文字数）を使用します。
+    rapidfuzzがインストールされている場合はそちらで計算します。
     
     Args:
         text1: 比較する文字列1
@@ -297,14 +494,53 @@ def similarity_ratio(text1: str, text2: str) -> float:
     if not text1 or not text2:
         return 0.0
     
-    # 簡易的なJaccard係数を使用
-    set1 = set(text1.lower())
-    set2 = set(text2.lower())
+    text1 = text1.lower()
+    text2 = text2.lower()
+    
+    if RAPIDFUZZ_AVAILABLE:
+        return Levenshtein.normalized_similarity(text1, text2)
+    
+    return 1.0 - _levenshtein_distance(text1, text2) / max(len(text1), len(text2))
+
+
+def similarity_ratio_matrix(texts: List[str]) -> List[List[float]]:
+    """
+    文字列リストの全ての組み合わせについて類似度を計算します。
+    類似度はsimilarity_ratio()と同じ定義で、対称性を利用して半分の組み合わせのみ計算します。
+    
+    Args:
+        texts: 比較する文字列のリスト
+    
+    Returns:
+        List[List[float]]: 類似度の行列（matrix[i][j]はtexts[i]とtexts[j]の類似度）
+    """
+    lowered = [text.lower() if text else '' for text in texts]
+    count = len(lowered)
+    matrix = [[1.0] * count for _ in range(count)]
     
-    intersection = len(set1.intersection(set2))
-    union = len(set1.union(set2))
+    # ビットマスクは文字列ごとに一度だけ作成する
+    masks = None if RAPIDFUZZ_AVAILABLE else [_char_position_masks(text) for text in lowered]
     
-    return intersection / union if union > 0 else 0.0
+    for i in range(count):
+        text1 = lowered[i]
+        row = matrix[i]
+        for j in range(i + 1, count):
+            text2 = lowered[j]
+            
+            if not text1 and not text2:
+                ratio = 1.0
+            elif not text1 or not text2:
+                ratio = 0.0
+            elif RAPIDFUZZ_AVAILABLE:
+                ratio = Levenshtein.normalized_similarity(text1, text2)
+            else:
+                distance = _levenshtein_distance(text1, text2, masks[i])
+                ratio = 1.0 - distance / max(len(text1), len(text2))
+            
+            row[j] = ratio
+            matrix[j][i] = ratio
+    
+    return matrix
 
 
 def clean_html_tags(text: str) -> str:
@@ -318,21 +554,9 @@ def clean_html_tags(text: str) -> str:
         str: HTMLタグが除去された文字列
     """
     # HTMLタグを除去
-    clean_text = re.sub(r'<[^>]+>', '', text)
-    # HTMLエンティティをデコード（基本的なもののみ）
-    html_entities = {
-        '&amp;': '&',
-        '&lt;': '<',
-        '&gt;': '>',
-        '&quot;': '"',
-        '&#39;': "'",
-        '&nbsp;': ' '
-    }
-    
-    for entity, char in html_entities.items():
-        clean_text = clean_text.replace(entity, char)
-    
-    return clean_text
+    clean_text = HTML_TAG_PATTERN.sub('', text)
+    # HTMLエンティティをデコード（基本的なもののみ、1回の走査で置換）
+    return HTML_ENTITY_PATTERN.sub(lambda match: HTML_ENTITIES[match.group(0)], clean_text)
 
 
 def validate_string_length(text: str, min_length: int = 0, 
@@ -8,10 +8,14 @@ import sys
 import platform
 import psutil
 import subprocess
+import functools
+import importlib.metadata
 import logging
-from typing import Dict, Any, List, Optional, Union
+import threading
+from typing import Dict, Any, List, Optional, Union, Iterator
 from datetime import datetime, timedelta
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 
 # ログ設定
 logger = logging.getLogger(__name__)
@@ -19,6 +23,35 @@ logger = logging.getLogger(__name__)
 # 定数定義
 BYTES_TO_GB = 1024 ** 3
 BYTES_TO_MB = 1024 ** 2
+PROCESS_INFO_ATTRS = ['pid', 'name', 'username', 'memory_percent', 'cpu_percent', 'memory_info']
+PARALLEL_PROCESS_THRESHOLD = 200  # この数を超えるプロセスは並列に情報を取得
+PROCESS_INFO_WORKERS = 8
+DISK_USAGE_TIMEOUT = 5  # ディスク使用量取得のタイムアウト（秒）
+
+# 実行中のディスク使用量取得（マウントポイント → Future）
+# 応答しないマウントに対して呼び出しごとにスレッドが増えないよう、完了するまで共有する
+_disk_usage_probes: Dict[str, Future] = {}
+_disk_usage_probes_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_platform_info() -> Dict[str, Any]:
+    """
+    プラットフォーム情報を取得します。
+    プロセスの実行中に変わらず、取得に外部コマンドの実行等を伴うため、初回の結果をキャッシュします。
+    
+    Returns:
+        Dict[str, Any]: プラットフォーム情報の辞書
+    """
+    return {
+        'system': platform.system(),
+        'release': platform.release(),
+        'version': platform.version(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'architecture': platform.architecture(),
+        'node': platform.node()
+    }
 
 
 def get_system_info() -> Dict[str, Any]:
@@ -30,15 +63,8 @@ def get_system_info() -> Dict[str, Any]:
     """
     try:
         info = {
-            'platform': {
-                'system': platform.system(),
-                'release': platform.release(),
-                'version': platform.version(),
-                'machine': platform.machine(),
-                'processor': platform.processor(),
-                'architecture': platform.architecture(),
-                'node': platform.node()
-            },
+            # キャッシュを呼び出し側の変更から守るためコピーを返す
+            'platform': dict(_get_platform_info()),
             'python': {
                 'version': sys.version,
                 'version_info': sys.version_info,
@@ -70,14 +96,20 @@ def get_cpu_info() -> Dict[str, Any]:
         Dict[str, Any]: CPU情報の辞書
     """
     try:
+        cpu_freq = psutil.cpu_freq()
+        
+        # 1回の計測（1秒）でコアごとの使用率を取得し、全体の使用率はその平均とする
+        usage_per_core = psutil.cpu_percent(interval=1, percpu=True)
+        usage_percent = round(sum(usage_per_core) / len(usage_per_core), 1) if usage_per_core else 0.0
+        
         cpu_info = {
             'physical_cores': psutil.cpu_count(logical=False),
             'logical_cores': psutil.cpu_count(logical=True),
-            'current_frequency': psutil.cpu_freq().current if psutil.cpu_freq() else None,
-            'max_frequency': psutil.cpu_freq().max if psutil.cpu_freq() else None,
-            'min_frequency': psutil.cpu_freq().min if psutil.cpu_freq() else None,
-            'usage_percent': psutil.cpu_percent(interval=1),
-            'usage_per_core': psutil.cpu_percent(interval=1, percpu=True),
+            'current_frequency': cpu_freq.current if cpu_freq else None,
+            'max_frequency': cpu_freq.max if cpu_freq else None,
+            'min_frequency': cpu_freq.min if cpu_freq else None,
+            'usage_percent': usage_percent,
+            'usage_per_core': usage_per_core,
             'load_average': os.getloadavg() if hasattr(os, 'getloadavg') else None
         }
         
@@ -124,9 +156,47 @@ def get_memory_info() -> Dict[str, Any]:
         return {'error': str(e)}
 
 
+def _probe_disk_usage(mountpoint: str) -> Future:
+    """
+    マウントポイントの使用量をデーモンスレッドで取得します。
+    同じマウントポイントの取得が実行中の場合は、新しいスレッドを起動せずにそのFutureを返します。
+    デーモンスレッドのため、応答しないマウント（NFS等）があってもインタープリタの終了を妨げません。
+    
+    Args:
+        mountpoint: マウントポイント
+    
+    Returns:
+        Future: psutil.disk_usageの結果を受け取るFuture
+    """
+    with _disk_usage_probes_lock:
+        future = _disk_usage_probes.get(mountpoint)
+        if future is not None:
+            return future
+        future = Future()
+        _disk_usage_probes[mountpoint] = future
+    
+    def probe() -> None:
+        try:
+            usage = psutil.disk_usage(mountpoint)
+        except BaseException as e:
+            with _disk_usage_probes_lock:
+                del _disk_usage_probes[mountpoint]
+            future.set_exception(e)
+        else:
+            with _disk_usage_probes_lock:
+                del _disk_usage_probes[mountpoint]
+            future.set_result(usage)
+    
+    threading.Thread(target=probe, name=f'disk-usage-{mountpoint}', daemon=True).start()
+    return future
+
+
 def get_disk_info() -> Dict[str, Any]:
     """
     ディスク情報を取得します。
+    各パーティションの使用量はデーモンスレッドで並列に取得し、応答しないマウント（NFS等）は
+    DISK_USAGE_TIMEOUT秒でスキップします。スキップしたマウントの取得スレッドは
+    次回以降の呼び出しで再利用されるため、呼び出しごとにスレッドは増えません。
     
     Returns:
         Dict[str, Any]: ディスク情報の辞書
@@ -136,10 +206,20 @@ def get_disk_info() -> Dict[str, Any]:
         
         # 全てのディスクパーティションを取得
         partitions = psutil.disk_partitions()
+        if not partitions:
+            return disk_info
         
-        for partition in partitions:
+        # 使用量を並列に取得（待ち時間は全マウントの合計ではなく最も遅いものになる）
+        probes = [(_probe_disk_usage(partition.mountpoint), partition) for partition in partitions]
+        wait([future for future, _ in probes], timeout=DISK_USAGE_TIMEOUT)
+        
+        for future, partition in probes:
+            if not future.done():
+                logger.warning(f"ディスク使用量取得タイムアウト: {partition.mountpoint}")
+                continue
+            
             try:
-                usage = psutil.disk_usage(partition.mountpoint)
+                usage = future.result()
                 
                 disk_info[partition.device] = {
                     'mountpoint': partition.mountpoint,
@@ -213,6 +293,31 @@ def get_network_info() -> Dict[str, Any]:
         return {'error': str(e)}
 
 
+def _collect_process_info(proc: psutil.Process) -> Optional[Dict[str, Any]]:
+    """
+    1つのプロセスの情報をまとめて取得します。
+
+    Args:
+        proc: 対象のプロセス
+
+    Returns:
+        Optional[Dict[str, Any]]: プロセス情報（取得できない場合はNone）
+    """
+    try:
+        # as_dictはoneshot()内で全属性を取得するため、メモリ情報も同じ読み込みで取得される
+        process_info = proc.as_dict(attrs=PROCESS_INFO_ATTRS)
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+
+    memory_info = process_info.pop('memory_info')
+    if memory_info is None:
+        # アクセス権限がない場合はスキップ
+        return None
+
+    process_info['memory_mb'] = round(memory_info.rss / BYTES_TO_MB, 2)
+    return process_info
+
+
 def get_process_list(sort_by: str = 'memory_percent') -> List[Dict[str, Any]]:
     """
     実行中のプロセス一覧を取得します。
@@ -224,15 +329,16 @@ def get_process_list(sort_by: str = 'memory_percent') -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: プロセス情報のリスト
     """
     try:
-        processes = []
+        procs = list(psutil.process_iter())
         
-        for proc in psutil.process_iter(['pid', 'name', 'username', 'memory_percent', 'cpu_percent']):
-            try:
-                process_info = proc.info
-                process_info['memory_mb'] = round(proc.memory_info().rss / BYTES_TO_MB, 2)
-                processes.append(process_info)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+        # プロセス数が多い場合はスレッドプールで並列に取得
+        if len(procs) > PARALLEL_PROCESS_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=PROCESS_INFO_WORKERS) as executor:
+                results = list(executor.map(_collect_process_info, procs))
+        else:
+            results = [_collect_process_info(proc) for proc in procs]
+        
+        processes = [process_info for process_info in results if process_info is not None]
         
         # ソート
         if sort_by in ['memory_percent', 'cpu_percent']:
@@ -305,10 +411,10 @@ def get_environment_variables(filter_prefix: Optional[str] = None) -> Dict[str,
         Dict[str, str]: 環境変数の辞書
     """
     try:
-        env_vars = dict(os.environ)
-        
         if filter_prefix:
-            env_vars = {k: v for k, v in env_vars.items() if k.startswith(filter_prefix)}
+            env_vars = {k: v for k, v in os.environ.items() if k.startswith(filter_prefix)}
+        else:
+            env_vars = dict(os.environ)
         
         logger.debug(f"環境変数取得完了: {len(env_vars)}件")
         return env_vars
@@ -414,6 +520,17 @@ def execute_command(command: Union[str, List[str]], timeout: int = 30,
         return result
 
 
+@functools.lru_cache(maxsize=1)
+def _get_boot_time() -> float:
+    """
+    システムの起動時刻（UNIX時刻）を取得します。起動時刻は変わらないため初回の結果をキャッシュします。
+    
+    Returns:
+        float: 起動時刻
+    """
+    return psutil.boot_time()
+
+
 def get_system_uptime() -> Dict[str, Any]:
     """
     システムの稼働時間を取得します。
@@ -422,7 +539,7 @@ def get_system_uptime() -> Dict[str, Any]:
         Dict[str, Any]: 稼働時間情報の辞書
     """
     try:
-        boot_time = datetime.fromtimestamp(psutil.boot_time())
+        boot_time = datetime.fromtimestamp(_get_boot_time())
         current_time = datetime.now()
         uptime = current_time - boot_time
         
@@ -444,9 +561,11 @@ def get_system_uptime() -> Dict[str, Any]:
         return {'error': str(e)}
 
 
+@functools.lru_cache(maxsize=1)
 def check_admin_privileges() -> bool:
     """
     管理者権限で実行されているかチェックします。
+    プロセスの実行中は変わらないものとして、初回の結果をキャッシュします。
     
     Returns:
         bool: 管理者権限の場合True
@@ -470,22 +589,49 @@ def get_installed_packages() -> List[Dict[str, str]]:
         List[Dict[str, str]]: パッケージ情報のリスト
     """
     try:
-        result = execute_command([sys.executable, '-m', 'pip', 'list', '--format=json'])
+        # pipをサブプロセスで起動せず、プロセス内でパッケージのメタデータを読み込む
+        packages = {}
+        for distribution in importlib.metadata.distributions():
+            name = distribution.metadata['Name']
+            if not name:
+                continue
+            # 同名のパッケージが複数ある場合はsys.pathで先に見つかるもの（実際にインポートされるもの）を優先
+            packages.setdefault(name.lower(), {'name': name, 'version': distribution.version})
+        
+        package_list = sorted(packages.values(), key=lambda package: package['name'].lower())
+        logger.debug(f"インストール済みパッケージ取得完了: {len(package_list)}件")
+        return package_list
         
-        if result['success']:
-            import json
-            packages = json.loads(result['stdout'])
-            logger.debug(f"インストール済みパッケージ取得完了: {len(packages)}件")
-            return packages
-        else:
-            logger.error("パッケージ一覧取得失敗")
-            return []
-            
     except Exception as e:
         logger.error(f"パッケージ一覧取得エラー: {str(e)}")
         return []
 
 
+def _iter_files(directory: Union[str, Path]) -> Iterator[os.DirEntry]:
+    """
+    ディレクトリ配下のファイルを再帰的に列挙します。
+    シンボリックリンクのディレクトリは辿りません。
+
+    Args:
+        directory: 走査するディレクトリ
+
+    Yields:
+        os.DirEntry: ファイルのエントリ
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from _iter_files(entry.path)
+                    elif entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
+    except (PermissionError, FileNotFoundError):
+        return
+
+
 def cleanup_temp_files(temp_dir: Optional[str] = None, older_than_days: int = 7) -> Dict[str, Any]:
     """
     一時ファイルをクリーンアップします。
@@ -506,21 +652,20 @@ def cleanup_temp_files(temp_dir: Optional[str] = None, older_than_days: int = 7)
         if not temp_dir.exists():
             return {'success': False, 'error': 'ディレクトリが存在しません'}
         
-        cutoff_time = datetime.now() - timedelta(days=older_than_days)
+        cutoff_timestamp = (datetime.now() - timedelta(days=older_than_days)).timestamp()
         deleted_files = []
         total_size = 0
         
-        for file_path in temp_dir.rglob('*'):
-            if file_path.is_file():
-                try:
-                    file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    if file_time < cutoff_time:
-                        file_size = file_path.stat().st_size
-                        file_path.unlink()
-                        deleted_files.append(str(file_path))
-                        total_size += file_size
-                except (PermissionError, FileNotFoundError):
-                    continue
+        for entry in _iter_files(temp_dir):
+            try:
+                # DirEntryのstat結果はキャッシュされるため、更新日時とサイズで再取得しない
+                file_stat = entry.stat()
+                if file_stat.st_mtime < cutoff_timestamp:
+                    os.unlink(entry.path)
+                    deleted_files.append(entry.path)
+                    total_size += file_stat.st_size
+            except (PermissionError, FileNotFoundError):
+                continue
         
         result = {
             'success': True,
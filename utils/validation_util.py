@@ -5,9 +5,10 @@
 
 import re
 import logging
-from typing import Any, List, Dict, Optional, Union, Callable
+import functools
+from typing import Any, List, Dict, Optional, Union, Callable, Iterable
 from datetime import datetime, date
-from urllib.parse import urlparse
+from ipaddress import IPv4Address, IPv6Address, ip_address
 
 # ログ設定
 logger = logging.getLogger(__name__)
@@ -18,11 +19,31 @@ PHONE_JP_PATTERN = re.compile(r'^(\+81|0)[0-9]{1,4}-?[0-9]{1,4}-?[0-9]{3,4}$')
 PHONE_MOBILE_JP_PATTERN = re.compile(r'^(\+81|0)[789]0-?[0-9]{4}-?[0-9]{4}$')
 ZIP_CODE_JP_PATTERN = re.compile(r'^\d{3}-?\d{4}$')
 CREDIT_CARD_PATTERN = re.compile(r'^[0-9]{13,19}$')
-IPV4_PATTERN = re.compile(r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$')
-IPV6_PATTERN = re.compile(r'^(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}$')
-HIRAGANA_PATTERN = re.compile(r'^[ひらがな\u3040-\u309F]+$')
-KATAKANA_PATTERN = re.compile(r'^[カタカナ\u30A0-\u30FF]+$')
+HIRAGANA_PATTERN = re.compile(r'^[\u3040-\u309F]+$')
+KATAKANA_PATTERN = re.compile(r'^[\u30A0-\u30FF]+$')
+JAPANESE_CHAR_PATTERN = re.compile(r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]')
 ALPHANUMERIC_PATTERN = re.compile(r'^[a-zA-Z0-9]+$')
+UPPERCASE_PATTERN = re.compile(r'[A-Z]')
+LOWERCASE_PATTERN = re.compile(r'[a-z]')
+DIGIT_PATTERN = re.compile(r'\d')
+SPECIAL_CHAR_PATTERN = re.compile(r'[!@#$%^&*()_+\-=\[\]{}|;:,.<>?]')
+
+VALID_URL_SCHEMES = frozenset(('http', 'https', 'ftp', 'ftps'))
+VALIDATION_CACHE_SIZE = 4096  # 検証結果のキャッシュ件数（関数ごと）
+CUSTOM_VALIDATOR_CACHE_SIZE = 256  # 生成済みカスタムバリデーターのキャッシュ件数
+
+# URL検証前に除去する文字（urllib.parseと同じく先頭の制御文字・空白と、全体のタブ・改行）
+_URL_C0_CONTROL_OR_SPACE = ''.join(map(chr, range(0x21)))
+_URL_UNSAFE_CHARS = str.maketrans('', '', '\t\r\n')
+
+# 辞書にキーが存在しないことを表す番兵
+_MISSING = object()
+
+# date_util.get_age（date_utilはdateutilに依存するため、初回のvalidate_age呼び出し時に読み込み）
+_get_age: Optional[Callable[[Union[datetime, date]], int]] = None
+
+# Luhnアルゴリズムで2倍した桁（0〜9）の各桁の和
+_LUHN_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
 
 
 class ValidationError(Exception):
@@ -33,13 +54,31 @@ class ValidationError(Exception):
 class ValidationResult:
     """バリデーション結果を格納するクラス"""
     
+    # 検証ごとに生成されるため、インスタンス辞書を持たせない
+    __slots__ = ('is_valid', '_errors')
+    
     def __init__(self, is_valid: bool = True, errors: Optional[List[str]] = None):
         self.is_valid = is_valid
-        self.errors = errors or []
+        # 大半の検証は成功するため、エラーリストは必要になるまで作成しない
+        self._errors = errors or None
+    
+    @property
+    def errors(self) -> List[str]:
+        """エラーメッセージのリスト"""
+        if self._errors is None:
+            self._errors = []
+        return self._errors
+    
+    @errors.setter
+    def errors(self, errors: List[str]) -> None:
+        self._errors = errors
     
     def add_error(self, error: str) -> None:
         """エラーメッセージを追加"""
-        self.errors.append(error)
+        if self._errors is None:
+            self._errors = [error]
+        else:
+            self._errors.append(error)
         self.is_valid = False
     
     def __bool__(self) -> bool:
@@ -48,7 +87,13 @@ class ValidationResult:
     def __str__(self) -> str:
         if self.is_valid:
             return "検証成功"
-        return f"検証失敗: {', '.join(self.errors)}"
+        return f"検証失敗: {', '.join(self._errors or ())}"
+
+
+@functools.lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _is_valid_email_cached(email: str) -> bool:
+    """is_valid_emailの検証結果を入力文字列ごとにキャッシュします。"""
+    return bool(EMAIL_PATTERN.match(email.strip()))
 
 
 def is_valid_email(email: str) -> bool:
@@ -64,7 +109,18 @@ def is_valid_email(email: str) -> bool:
     if not email or not isinstance(email, str):
         return False
     
-    return bool(EMAIL_PATTERN.match(email.strip()))
+    return _is_valid_email_cached(email)
+
+
+@functools.lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _is_valid_phone_jp_cached(phone: str, mobile_only: bool) -> bool:
+    """is_valid_phone_jpの検証結果を入力文字列ごとにキャッシュします。"""
+    phone = phone.replace(' ', '').replace('-', '')
+    
+    if mobile_only:
+        return bool(PHONE_MOBILE_JP_PATTERN.match(phone))
+    else:
+        return bool(PHONE_JP_PATTERN.match(phone))
 
 
 def is_valid_phone_jp(phone: str, mobile_only: bool = False) -> bool:
@@ -81,12 +137,13 @@ def is_valid_phone_jp(phone: str, mobile_only: bool = False) -> bool:
     if not phone or not isinstance(phone, str):
         return False
     
-    phone = phone.replace(' ', '').replace('-', '')
-    
-    if mobile_only:
-        return bool(PHONE_MOBILE_JP_PATTERN.match(phone))
-    else:
-        return bool(PHONE_JP_PATTERN.match(phone))
+    return _is_valid_phone_jp_cached(phone, mobile_only)
+
+
+@functools.lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _is_valid_zip_code_jp_cached(zip_code: str) -> bool:
+    """is_valid_zip_code_jpの検証結果を入力文字列ごとにキャッシュします。"""
+    return bool(ZIP_CODE_JP_PATTERN.match(zip_code.strip()))
 
 
 def is_valid_zip_code_jp(zip_code: str) -> bool:
@@ -102,7 +159,33 @@ def is_valid_zip_code_jp(zip_code: str) -> bool:
     if not zip_code or not isinstance(zip_code, str):
         return False
     
-    return bool(ZIP_CODE_JP_PATTERN.match(zip_code.strip()))
+    return _is_valid_zip_code_jp_cached(zip_code)
+
+
+@functools.lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _is_valid_url_cached(url: str, require_https: bool) -> bool:
+    """is_valid_urlの検証結果を入力文字列ごとにキャッシュします。"""
+    url = url.strip()
+    if not url.isprintable():
+        # urlparseと同様に先頭の制御文字とタブ・改行を除去
+        url = url.lstrip(_URL_C0_CONTROL_OR_SPACE).translate(_URL_UNSAFE_CHARS)
+    
+    # スキームとそれ以降に分割（スキームは大文字小文字を区別しない）
+    scheme, separator, rest = url.partition('://')
+    if not separator:
+        return False
+    scheme = scheme.lower()
+    
+    # 有効なスキームかどうか確認
+    if scheme not in VALID_URL_SCHEMES:
+        return False
+    
+    # HTTPSが必須の場合
+    if require_https and scheme != 'https':
+        return False
+    
+    # ネットロケーション（次の/?#まで）が空でないことを確認
+    return bool(rest) and rest[0] not in '/?#'
 
 
 def is_valid_url(url: str, require_https: bool = False) -> bool:
@@ -119,26 +202,28 @@ def is_valid_url(url: str, require_https: bool = False) -> bool:
     if not url or not isinstance(url, str):
         return False
     
+    return _is_valid_url_cached(url, require_https)
+
+
+@functools.lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _is_valid_ip_address_cached(ip: str, version: Optional[int]) -> bool:
+    """is_valid_ip_addressの検証結果を入力文字列ごとにキャッシュします。"""
+    ip = ip.strip()
+    
+    # 標準ライブラリのパーサーで検証（IPv6の::省略表記にも対応）
     try:
-        parsed = urlparse(url.strip())
-        
-        # スキームとネットロケーションが存在することを確認
-        if not parsed.scheme or not parsed.netloc:
+        if version is None:
+            ip_address(ip)
+        elif version == 4:
+            IPv4Address(ip)
+        elif version == 6:
+            IPv6Address(ip)
+        else:
             return False
-        
-        # HTTPSが必須の場合
-        if require_https and parsed.scheme != 'https':
-            return False
-        
-        # 有効なスキームかどうか確認
-        valid_schemes = ['http', 'https', 'ftp', 'ftps']
-        if parsed.scheme not in valid_schemes:
-            return False
-        
-        return True
-        
-    except Exception:
+    except ValueError:
         return False
+    
+    return True
 
 
 def is_valid_ip_address(ip: str, version: Optional[int] = None) -> bool:
@@ -155,17 +240,19 @@ def is_valid_ip_address(ip: str, version: Optional[int] = None) -> bool:
     if not ip or not isinstance(ip, str):
         return False
     
-    ip = ip.strip()
-    
-    if version == 4 or version is None:
-        if IPV4_PATTERN.match(ip):
-            return True
-    
-    if version == 6 or version is None:
-        if IPV6_PATTERN.match(ip):
-            return True
-    
-    return False
+    return _is_valid_ip_address_cached(ip, version)
+
+
+def clear_validation_caches() -> None:
+    """
+    形式検証関数（is_valid_email, is_valid_phone_jp, is_valid_zip_code_jp,
+    is_valid_url, is_valid_ip_address）の結果キャッシュをクリアします。
+    """
+    _is_valid_email_cached.cache_clear()
+    _is_valid_phone_jp_cached.cache_clear()
+    _is_valid_zip_code_jp_cached.cache_clear()
+    _is_valid_url_cached.cache_clear()
+    _is_valid_ip_address_cached.cache_clear()
 
 
 def is_valid_credit_card(card_number: str, validate_luhn: bool = True) -> bool:
@@ -206,19 +293,13 @@ def _validate_luhn(card_number: str) -> bool:
     Returns:
         bool: Luhnアルゴリズムで有効な場合True
     """
-    def luhn_checksum(card_num):
-        def digits_of(n):
-            return [int(d) for d in str(n)]
-        
-        digits = digits_of(card_num)
-        odd_digits = digits[-1::-2]
-        even_digits = digits[-2::-2]
-        checksum = sum(odd_digits)
-        for d in even_digits:
-            checksum += sum(digits_of(d * 2))
-        return checksum % 10
+    checksum = 0
+    for i, char in enumerate(reversed(card_number)):
+        digit = ord(char) - 48
+        # 右から偶数番目の桁は2倍した値の各桁の和を加算
+        checksum += _LUHN_DOUBLED[digit] if i % 2 else digit
     
-    return luhn_checksum(card_number) == 0
+    return checksum % 10 == 0
 
 
 def is_valid_japanese_text(text: str, text_type: str = 'any') -> bool:
@@ -243,8 +324,7 @@ def is_valid_japanese_text(text: str, text_type: str = 'any') -> bool:
         return bool(KATAKANA_PATTERN.match(text))
     else:
         # 日本語文字（ひらがな、カタカナ、漢字）が含まれているかチェック
-        japanese_chars = re.findall(r'[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]', text)
-        return len(japanese_chars) > 0
+        return JAPANESE_CHAR_PATTERN.search(text) is not None
 
 
 def validate_password_strength(password: str, min_length: int = 8,
@@ -277,19 +357,19 @@ def validate_password_strength(password: str, min_length: int = 8,
         result.add_error(f"パスワードは{min_length}文字以上である必要があります")
     
     # 大文字チェック
-    if require_uppercase and not re.search(r'[A-Z]', password):
+    if require_uppercase and not UPPERCASE_PATTERN.search(password):
         result.add_error("パスワードには大文字を含める必要があります")
     
     # 小文字チェック
-    if require_lowercase and not re.search(r'[a-z]', password):
+    if require_lowercase and not LOWERCASE_PATTERN.search(password):
         result.add_error("パスワードには小文字を含める必要があります")
     
     # 数字チェック
-    if require_digits and not re.search(r'\d', password):
+    if require_digits and not DIGIT_PATTERN.search(password):
         result.add_error("パスワードには数字を含める必要があります")
     
     # 特殊文字チェック
-    if require_special and not re.search(r'[!@#$%^&*()_+\-=\[\]{}|;:,.<>?]', password):
+    if require_special and not SPECIAL_CHAR_PATTERN.search(password):
         result.add_error("パスワードには特殊文字を含める必要があります")
     
     logger.debug(f"パスワード強度検証完了: {result}")
@@ -314,9 +394,12 @@ def validate_age(birth_date: Union[datetime, date], min_age: int = 0, max_age: i
         result.add_error("生年月日が指定されていません")
         return result
     
+    global _get_age
+    
     try:
-        from .date_util import get_age
-        age = get_age(birth_date)
+        if _get_age is None:
+            from .date_util import get_age as _get_age
+        age = _get_age(birth_date)
         
         if age < min_age:
             result.add_error(f"年齢は{min_age}歳以上である必要があります")
@@ -349,9 +432,10 @@ def validate_required_fields(data: Dict[str, Any], required_fields: List[str]) -
         return result
     
     for field in required_fields:
-        if field not in data:
+        value = data.get(field, _MISSING)
+        if value is _MISSING:
             result.add_error(f"必須フィールド '{field}' が存在しません")
-        elif data[field] is None or (isinstance(data[field], str) and not data[field].strip()):
+        elif value is None or (isinstance(value, str) and not value.strip()):
             result.add_error(f"必須フィールド '{field}' が空です")
     
     logger.debug(f"必須フィールド検証完了: {result}")
@@ -376,14 +460,85 @@ def validate_data_types(data: Dict[str, Any], type_specs: Dict[str, type]) -> Va
         return result
     
     for field, expected_type in type_specs.items():
-        if field in data and data[field] is not None:
-            if not isinstance(data[field], expected_type):
-                result.add_error(f"フィールド '{field}' の型が正しくありません。期待: {expected_type.__name__}, 実際: {type(data[field]).__name__}")
+        value = data.get(field)
+        if value is not None and not isinstance(value, expected_type):
+            result.add_error(f"フィールド '{field}' の型が正しくありません。期待: {expected_type.__name__}, 実際: {type(value).__name__}")
     
     logger.debug(f"データ型検証完了: {result}")
     return result
 
 
+# validate_recordで使用する形式名と検証関数の対応表
+_FORMAT_VALIDATORS: Dict[str, Callable[[str], bool]] = {
+    'email': is_valid_email,
+    'phone_jp': is_valid_phone_jp,
+    'zip_code_jp': is_valid_zip_code_jp,
+    'url': is_valid_url,
+    'ip_address': is_valid_ip_address,
+    'credit_card': is_valid_credit_card,
+    'japanese_text': is_valid_japanese_text,
+}
+
+
+def validate_record(data: Dict[str, Any], schema: Dict[str, str]) -> ValidationResult:
+    """
+    レコードの各フィールドを指定された形式でまとめて検証します。
+    
+    Args:
+        data: 検証するデータ辞書
+        schema: フィールド名と形式名（'email', 'phone_jp', 'zip_code_jp', 'url',
+                'ip_address', 'credit_card', 'japanese_text'）の辞書
+    
+    Returns:
+        ValidationResult: 検証結果
+    
+    Raises:
+        ValueError: サポートされていない形式名が指定された場合
+    """
+    result = ValidationResult()
+    
+    if not isinstance(data, dict):
+        result.add_error("データが辞書形式ではありません")
+        return result
+    
+    for field, format_name in schema.items():
+        validator = _FORMAT_VALIDATORS.get(format_name)
+        if validator is None:
+            raise ValueError(f"サポートされていない検証形式: {format_name}")
+        
+        value = data.get(field)
+        if value is not None and not validator(value):
+            result.add_error(f"フィールド '{field}' の形式が正しくありません（{format_name}）")
+    
+    logger.debug(f"レコード検証完了: {result}")
+    return result
+
+
+def is_valid_batch(values: Iterable[Any], format_name: str, **options: Any) -> List[bool]:
+    """
+    複数の値を同じ形式でまとめて検証します。
+    
+    Args:
+        values: 検証する値のイテラブル（CSVの列など）
+        format_name: 形式名（validate_recordと同じ: 'email', 'phone_jp', 'url' など）
+        **options: 検証関数に渡すオプション（mobile_only, require_https など）
+    
+    Returns:
+        List[bool]: 各値の検証結果（入力と同じ順序）
+    
+    Raises:
+        ValueError: サポートされていない形式名が指定された場合
+    """
+    validator = _FORMAT_VALIDATORS.get(format_name)
+    if validator is None:
+        raise ValueError(f"サポートされていない検証形式: {format_name}")
+    
+    if options:
+        validator = functools.partial(validator, **options)
+    
+    return list(map(validator, values))
+
+
 def validate_string_length(text: str, field_name: str, min_length: int = 0, 
                           max_length: Optional[int] = None) -> ValidationResult:
     """
@@ -447,10 +602,27 @@ def validate_numeric_range(value: Union[int, float], field_name: str,
     return result
 
 
+@functools.lru_cache(maxsize=CUSTOM_VALIDATOR_CACHE_SIZE)
+def _build_custom_validator(validation_func: Callable[[Any], bool],
+                            error_message: str) -> Callable[[Any], ValidationResult]:
+    """検証関数とエラーメッセージの組ごとにバリデーター関数を生成してキャッシュします。"""
+    def validator(value: Any) -> ValidationResult:
+        result = ValidationResult()
+        try:
+            if not validation_func(value):
+                result.add_error(error_message)
+        except Exception as e:
+            result.add_error(f"検証エラー: {str(e)}")
+        return result
+    
+    return validator
+
+
 def create_custom_validator(validation_func: Callable[[Any], bool], 
                            error_message: str) -> Callable[[Any], ValidationResult]:
     """
     カスタムバリデーターを作成します。
+    同じ検証関数とエラーメッセージの組に対しては、生成済みのバリデーターを再利用します。
     
     Args:
         validation_func: 検証関数
@@ -459,13 +631,8 @@ def create_custom_validator(validation_func: Callable[[Any], bool],
     Returns:
         Callable: バリデーター関数
     """
-    def validator(value: Any) -> ValidationResult:
-        result = ValidationResult()
-        try:
-            if not validation_func(value):
-                result.add_error(error_message)
-        except Exception as e:
-            result.add_error(f"検証エラー: {str(e)}")
-        return result
-    
-    return validator
+    try:
+        return _build_custom_validator(validation_func, error_message)
+    except TypeError:
+        # ハッシュ化できない呼び出し可能オブジェクトはキャッシュせずに生成
+        return _build_custom_validator.__wrapped__(validation_func, error_message)